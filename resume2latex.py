@@ -7,35 +7,66 @@ import json
 import sys
 import re
 import argparse
+import contextlib
+import copy
+import glob
+import hashlib
+import io
 import os
 import platform
 import subprocess
 import tempfile
 import shutil
+import mmap
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+# Prefer orjson for JSON parsing when installed (C implementation, several
+# times faster than the stdlib on resume-sized documents); fall back to json.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+# Translation table for LaTeX special characters, built once at import.
+# Mapping backslash in the same table means escape order is no longer a hazard.
+_LATEX_TRANS = str.maketrans({
+    '\\': '\\textbackslash{}',
+    '&': '\\&',
+    '%': '\\%',
+    '$': '\\$',
+    '#': '\\#',
+    '_': '\\_',
+    '{': '\\{',
+    '}': '\\}',
+    '~': '\\textasciitilde{}',
+    '^': '\\textasciicircum{}',
+})
+
+# Matches any character escape_latex would rewrite; used to skip the
+# translate pass (and its string allocation) for the common clean field
+_SPECIAL_RE = re.compile(r'[\\&%$#_{}~^]')
+
+@lru_cache(maxsize=2048)
 def escape_latex(text):
     """Escape LaTeX special characters in text"""
     if not text:
         return ""
-    
-    # Note: order matters for backslash
-    text = text.replace('\\', '\\\\')  # Escape backslashes first
-    text = text.replace('&', '\\&')
-    text = text.replace('%', '\\%')
-    text = text.replace('$', '\\$')
-    text = text.replace('#', '\\#')
-    text = text.replace('_', '\\_')
-    text = text.replace('{', '\\{')
-    text = text.replace('}', '\\}')
-    text = text.replace('~', '\\textasciitilde{}')
-    text = text.replace('^', '\\textasciicircum{}')
-    
-    return text
+
+    # Most fields (names, dates, locations) contain no specials at all;
+    # one C-level scan confirms that and returns the input unchanged
+    if _SPECIAL_RE.search(text) is None:
+        return text
+
+    # Single C-level pass instead of one .replace() per special character
+    return text.translate(_LATEX_TRANS)
 
 def get_single_char_input():
     """Get a line of input from the user and return it as a stripped, lowercase string."""
@@ -44,34 +75,36 @@ def get_single_char_input():
     except (EOFError, KeyboardInterrupt):
         return "n"  # Default to no if input is not available
 
+# Accepted spellings for interactive prompts; frozensets hash the lookup
+# instead of scanning a throwaway list at each prompt
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+
+# Characters that could enable shell injection or odd filesystem behavior
+_DANGEROUS_CHARS = frozenset(';|&`$(){}[]"\'')
+
+# Working directory, resolved once at import; every validated path must
+# stay inside it
+_CWD = Path.cwd().resolve()
+
 def validate_file_path(file_path):
     """Validate file path for security"""
     if not file_path or not isinstance(file_path, str):
         return False
-    
-    # Check for path traversal attempts
-    if '..' in file_path:
+
+    # Containment check against the cached working directory. resolve()
+    # normalizes any '..' components, so traversal attempts that escape
+    # the directory fail here; a prefix comparison would wrongly accept
+    # siblings like /tmp/foo-evil for /tmp/foo.
+    try:
+        Path(file_path).resolve().relative_to(_CWD)
+    except (OSError, ValueError):
         return False
-    
-    # Allow absolute paths only if they're in the current directory or subdirectories
-    if os.path.isabs(file_path):
-        # Get current working directory
-        current_dir = os.getcwd()
-        # Check if the file path is within the current directory
-        try:
-            # Resolve the absolute path
-            abs_path = os.path.abspath(file_path)
-            # Check if it's within current directory
-            if not abs_path.startswith(current_dir):
-                return False
-        except (OSError, ValueError):
-            return False
-    
-    # Check for potentially dangerous characters
-    dangerous_chars = [';', '|', '&', '`', '$', '(', ')', '{', '}', '[', ']', '"', "'"]
-    if any(char in file_path for char in dangerous_chars):
+
+    # Check for potentially dangerous characters (single pass over the path)
+    if not _DANGEROUS_CHARS.isdisjoint(file_path):
         return False
-    
+
     return True
 
 def safe_subprocess_run(cmd, **kwargs):
@@ -87,7 +120,7 @@ def safe_subprocess_run(cmd, **kwargs):
     # Only allow specific safe commands
     safe_commands = {
         'brew', 'apt-get', 'yum', 'which', 'pdflatex', 'latexmk',
-        'python3', 'pip', 'curl', 'wget'
+        'tectonic', 'python3', 'pip', 'curl', 'wget'
     }
     
     # Check the base name of the command against the safe list
@@ -96,13 +129,19 @@ def safe_subprocess_run(cmd, **kwargs):
     
     return subprocess.run(cmd, **kwargs)
 
+# Filename sanitizer: any run of characters outside [A-Za-z0-9-] collapses
+# into a single underscore
+_FILENAME_SAFE_RE = re.compile(r'[^A-Za-z0-9-]+')
+
+# Filenames handed to pdflatex must be plain alphanumerics/underscores/hyphens
+_SAFE_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
 def generate_output_filename(resume_data):
     """Generate output filename based on name"""
     # Get name from resume data, clean it for filename
     name = resume_data['personal_info']['name']
     # Replace spaces with hyphens and other special characters with underscores
-    clean_name = name.replace(' ', '-')
-    clean_name = re.sub(r'[^a-zA-Z0-9\-]', '_', clean_name).strip('_')
+    clean_name = _FILENAME_SAFE_RE.sub('_', name.replace(' ', '-')).strip('_')
 
     # Generate filename: YOUR-NAME_resume.tex
     filename = f"{clean_name}_resume.tex"
@@ -121,11 +160,12 @@ def load_resume_data(json_file):
     
     try:
         with open(json_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return _json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: {json_file} not found")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
         print(f"Error: Invalid JSON in {json_file}: {e}")
         sys.exit(1)
 
@@ -133,9 +173,9 @@ def load_resume_data(json_file):
 # LATEX GENERATION
 # =============================================================================
 
-def generate_latex_header():
-    """Generate LaTeX document header"""
-    return r"""\documentclass[letterpaper,11pt]{article}
+# The document header and footer are fixed text with no inputs; keep them
+# as module constants instead of functions that rebuild and return them.
+_LATEX_HEADER = r"""\documentclass[letterpaper,11pt]{article}
 
 %---------- PACKAGES ----------
 \usepackage{latexsym}
@@ -246,241 +286,303 @@ def generate_latex_header():
 %---------- HEADING ----------
 """
 
-def generate_heading(personal_info):
-    """Generate the heading section"""
-    name = escape_latex(personal_info['name'])
-    phone = escape_latex(personal_info['phone'])
-    email = escape_latex(personal_info['email'])
-    location = escape_latex(personal_info['location'])
-    website = escape_latex(personal_info['website'])
-
-    return f"""%---------- HEADING ----------
-\\begin{{center}}
-    \\textbf{{\\Huge \\scshape {name}}} \\\\ \\vspace{{3pt}}
+# Section templates, parsed once at import. %-formatting on pre-escaped
+# strings avoids re-parsing a large f-string literal on every call and
+# spares the {{ }} doubling that LaTeX-heavy f-strings need; the named
+# placeholders are batch-expanded from a dict built per call.
+_HEADING_TMPL = """%%---------- HEADING ----------
+\\begin{center}
+    \\textbf{\\Huge \\scshape %(name)s} \\\\ \\vspace{3pt}
     \\small
-    {phone} $|$ {email} $|$ {location} $|$ {website}
-\\end{{center}}
+    %(phone)s $|$ %(email)s $|$ %(location)s $|$ %(website)s
+\\end{center}
 
 """
 
-def generate_education(education):
-    """Generate the education section"""
-    institution = escape_latex(education['institution'])
-    location = escape_latex(education['location'])
-    degree = escape_latex(education['degree'])
-    period = escape_latex(education['period'])
-    core_modules = escape_latex(', '.join(education['details']['core_modules']))
-    grade = escape_latex(education['details']['grade'])
-
-    latex = f"""%---------- EDUCATION -----------
-\\section{{EDUCATION}}
-  \\vspace{{3pt}}
+_EDUCATION_TMPL = """%%---------- EDUCATION -----------
+\\section{EDUCATION}
+  \\vspace{3pt}
   \\resumeSubHeadingListStart
 
     \\resumeEducationHeading
-      {{{institution}}}{{{location}}}
-      {{{degree}}}{{{period}}}
+      {%(institution)s}{%(location)s}
+      {%(degree)s}{%(period)s}
 
         \\resumeItemListStart
-            \\resumeItem{{Core Modules: {core_modules}}}
-            \\resumeItem{{Grade: {grade}}}
+            \\resumeItem{Core Modules: %(core_modules)s}
+            \\resumeItem{Grade: %(grade)s}
         \\resumeItemListEnd
 
   \\resumeSubHeadingListEnd
 
 """
-    return latex
 
-def generate_professional_experience(experiences):
-    """Generate the professional experience section"""
-    latex = """%---------- PROFESSIONAL EXPERIENCE -----------
+_ADDITIONAL_INFO_TMPL = """%%---------- ADDITIONAL INFORMATION -----------
+\\section{ADDITIONAL INFORMATION}
+  \\vspace{2pt}
+  \\resumeSubHeadingListStart
+    \\small{\\item{
+        \\textbf{Languages:} %(languages)s \\\\ \\vspace{3pt}
+
+        \\textbf{Skills:} %(skills)s \\\\ \\vspace{3pt}
+    }}
+  \\resumeSubHeadingListEnd
+
+"""
+
+def generate_heading(personal_info):
+    """Generate the heading section"""
+    fields = {key: escape_latex(personal_info[key])
+              for key in ('name', 'phone', 'email', 'location', 'website')}
+
+    return _HEADING_TMPL % fields
+
+def generate_education(education):
+    """Generate the education section"""
+    fields = {key: escape_latex(education[key])
+              for key in ('institution', 'location', 'degree', 'period')}
+    fields['core_modules'] = ', '.join(education['details']['core_modules']).translate(_LATEX_TRANS)
+    fields['grade'] = escape_latex(education['details']['grade'])
+
+    return _EDUCATION_TMPL % fields
+
+# Per-entry skeletons, hoisted so the loops below only run a C-level
+# %-substitution; positional slots keep the per-entry work to one tuple
+_SUBHEADING_TMPL = """    \\resumeSubheading
+      {%s}{%s}
+      {%s}{%s}"""
+
+_PROJECT_HEADING_TMPL = """      \\resumeProjectHeading
+        {\\textbf{%s}}{%s}"""
+
+def write_professional_experience(experiences, out):
+    """Write the professional experience section to a file-like object
+
+    Fragments go straight to `out` as they are produced, so only one
+    entry's worth of text is ever live at a time.
+    """
+    _write = out.write
+    _write("""%---------- PROFESSIONAL EXPERIENCE -----------
 \\section{PROFESSIONAL EXPERIENCE}
   \\vspace{3pt}
   \\resumeSubHeadingListStart
 
-"""
+""")
 
-    for exp in experiences:
-        company = escape_latex(exp['company'])
-        location = escape_latex(exp['location'])
-        position = escape_latex(exp['position'])
-        period = escape_latex(exp['period'])
+    # Bind hot lookups to locals; LOAD_FAST beats LOAD_GLOBAL/LOAD_METHOD
+    # in the per-entry loop
+    _esc = escape_latex
 
-        latex += f"""    \\resumeSubheading
-      {{{company}}}{{{location}}}
-      {{{position}}}{{{period}}}"""
+    for exp in experiences:
+        _write(_SUBHEADING_TMPL % (_esc(exp['company']), _esc(exp['location']),
+                                   _esc(exp['position']), _esc(exp['period'])))
 
         if exp['description']:
-            latex += "\n        \\resumeItemListStart\n"
-            for description in exp['description']:
-                description_escaped = escape_latex(description)
-                latex += f"            \\resumeItem{{{description_escaped}}}\n"
-            latex += "        \\resumeItemListEnd\n"
+            # One C-level join over a generator instead of a Python-level
+            # write per bullet
+            bullets = "".join(f"            \\resumeItem{{{_esc(d)}}}\n"
+                              for d in exp['description'])
+            _write("\n        \\resumeItemListStart\n"
+                   f"{bullets}"
+                   "        \\resumeItemListEnd\n")
         else:
-            latex += "\n"
+            _write("\n")
 
-    latex += "  \\resumeSubHeadingListEnd\n\n"
-    return latex
+    _write("  \\resumeSubHeadingListEnd\n\n")
 
-def generate_project_experience(projects):
-    """Generate the project experience section"""
-    latex = """%---------- PROJECT EXPERIENCE -----------
+def write_project_experience(projects, out):
+    """Write the project experience section to a file-like object"""
+    _write = out.write
+    _write("""%---------- PROJECT EXPERIENCE -----------
 \\section{PROJECT EXPERIENCE}
     \\vspace{3pt}
     \\resumeSubHeadingListStart
 
-"""
+""")
 
-    for project in projects:
-        name = escape_latex(project['name'])
-        period = escape_latex(project['period'])
+    _esc = escape_latex
 
-        latex += f"""      \\resumeProjectHeading
-        {{\\textbf{{{name}}}}}{{{period}}}"""
+    for project in projects:
+        _write(_PROJECT_HEADING_TMPL % (_esc(project['name']),
+                                        _esc(project['period'])))
 
         if 'description' in project:
-            latex += "\n          \\resumeItemListStart\n"
-            for description in project['description']:
-                description_escaped = escape_latex(description)
-                latex += f"            \\resumeItem{{{description_escaped}}}\n"
-            latex += "          \\resumeItemListEnd\n"
+            bullets = "".join(f"            \\resumeItem{{{_esc(d)}}}\n"
+                              for d in project['description'])
+            _write("\n          \\resumeItemListStart\n"
+                   f"{bullets}"
+                   "          \\resumeItemListEnd\n")
         else:
-            latex += "\n"
+            _write("\n")
 
-    latex += "    \\resumeSubHeadingListEnd\n\n"
-    return latex
+    _write("    \\resumeSubHeadingListEnd\n\n")
 
 def generate_additional_information(additional_info):
     """Generate the additional information section"""
     languages = additional_info['languages']
     skills = additional_info['skills']
 
-    languages_str = ", ".join([f"{lang['language']} ({lang['proficiency']})" for lang in languages])
-    skills_str = ", ".join(skills)
-
-    # Escape special characters
-    languages_str = escape_latex(languages_str)
-    skills_str = escape_latex(skills_str)
-
-    return f"""%---------- ADDITIONAL INFORMATION -----------
-\\section{{ADDITIONAL INFORMATION}}
-  \\vspace{{2pt}}
-  \\resumeSubHeadingListStart
-    \\small{{\\item{{
-        \\textbf{{Languages:}} {languages_str} \\\\ \\vspace{{3pt}}
-
-        \\textbf{{Skills:}} {skills_str} \\\\ \\vspace{{3pt}}
-    }}}}
-  \\resumeSubHeadingListEnd
+    # Escape per field before formatting (so specials in a language name
+    # stay local to it) and feed the joins generator expressions rather
+    # than materializing throwaway lists
+    languages_str = ", ".join(
+        f"{escape_latex(lang['language'])} ({escape_latex(lang['proficiency'])})"
+        for lang in languages)
+    skills_str = ", ".join(escape_latex(skill) for skill in skills)
 
-"""
+    return _ADDITIONAL_INFO_TMPL % {'languages': languages_str, 'skills': skills_str}
 
-def generate_latex_footer():
-    """Generate LaTeX document footer"""
-    return """%-------------------------------------------
+_LATEX_FOOTER = """%-------------------------------------------
 \\end{document}
 """
 
-def generate_resume_latex(resume_data):
-    """Generate complete LaTeX resume from JSON data"""
-    latex_content = ""
-
-    # Header
-    latex_content += generate_latex_header()
-
-    # Heading
-    latex_content += generate_heading(resume_data['personal_info'])
-
-    # Education
-    latex_content += generate_education(resume_data['education'])
-
-    # Professional Experience
-    latex_content += generate_professional_experience(resume_data['professional_experience'])
-
-    # Project Experience
-    latex_content += generate_project_experience(resume_data['project_experience'])
+def write_resume_latex(resume_data, out):
+    """Write the complete LaTeX resume to a file-like object
 
-    # Additional Information
-    latex_content += generate_additional_information(resume_data['additional_information'])
+    Streams one section at a time so the full document is never
+    materialized as a single in-memory string.
+    """
+    out.write(_LATEX_HEADER)
+    out.write(generate_heading(resume_data['personal_info']))
+    out.write(generate_education(resume_data['education']))
+    write_professional_experience(resume_data['professional_experience'], out)
+    write_project_experience(resume_data['project_experience'], out)
+    out.write(generate_additional_information(resume_data['additional_information']))
+    out.write(_LATEX_FOOTER)
 
-    # Footer
-    latex_content += generate_latex_footer()
-
-    return latex_content
+def generate_resume_latex(resume_data):
+    """Generate complete LaTeX resume from JSON data as a single string"""
+    # Thin wrapper over the streaming writer so there is one section
+    # ordering to maintain
+    buf = io.StringIO()
+    write_resume_latex(resume_data, buf)
+    return buf.getvalue()
 
 # =============================================================================
 # VALIDATION
 # =============================================================================
 
-def validate_latex_syntax(filename):
-    """Validate LaTeX syntax in the generated file"""
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        print(f"Validating {filename}...")
-        print("=" * 50)
-
-        issues = []
-
-        # Check for unescaped special characters in content (not comments)
-        # Remove LaTeX comments first
-        content_no_comments = re.sub(r'%.*$', '', content, flags=re.MULTILINE)
-        unescaped_percent = re.findall(r'(?<!\\)%', content_no_comments)
+# Validator patterns, compiled once at module load. These are byte patterns:
+# the validator works on the raw file buffer (the LaTeX-critical characters
+# are all single-byte in UTF-8), so no decode pass is needed.
+# Files at or below this size are validated from a plain read; larger
+# ones are memory-mapped
+_MMAP_THRESHOLD = 1 << 20
+
+# Delete table keeping only the two brace characters
+_NON_BRACE = bytes(b for b in range(256) if b not in (ord('{'), ord('}')))
+
+def _count_braces(content):
+    """Count opening and closing braces in the given buffer
+
+    bytes.translate with a delete table strips everything except braces
+    at C speed, so the two counts then run over a buffer that is a tiny
+    fraction of the document. Processes the buffer in slices so a
+    memory-mapped file is never copied wholesale.
+    """
+    open_braces = 0
+    close_braces = 0
+    for start in range(0, len(content), _MMAP_THRESHOLD):
+        braces = content[start:start + _MMAP_THRESHOLD].translate(None, _NON_BRACE)
+        open_braces += braces.count(b'{')
+        close_braces += braces.count(b'}')
+    return open_braces, close_braces
+
+# Structural elements every valid document must contain, in order
+_REQUIRED_ELEMENTS = (b'\\documentclass', b'\\begin{document}', b'\\end{document}')
+
+# A percent is suspect when it is neither escaped nor a comment line:
+# preceded by a character that is not a backslash and not a newline
+# One alternation covers both unescaped-character checks so the document
+# body is scanned a single time: mid-line % not preceded by a backslash,
+# and & that is neither escaped nor part of an entity-like token
+_UNESC_CHAR_RE = re.compile(rb'(?<=[^\\\n])%|(?<!\\)&(?!\w)')
+
+def _validate_content(content, name):
+    """Validate LaTeX syntax of an in-memory document
+
+    `content` is bytes or an mmap; `name` labels the report. Callers that
+    already hold the document (e.g. right after generating it) use this
+    directly and skip a round-trip through the filesystem.
+    """
+    # Buffer all report lines and flush them in one write at the end
+    lines = [f"Validating {name}...", _RULE]
+
+    issues = []
+
+    # Check for unescaped special characters only in content after
+    # \begin{document}; the preamble legitimately uses both % and &
+    doc_start = content.find(b'\\begin{document}')
+    if doc_start != -1:
+        unescaped_percent = 0
+        unescaped_ampersand = 0
+        for match in _UNESC_CHAR_RE.finditer(content, doc_start):
+            if match.group() == b'%':
+                unescaped_percent += 1
+            else:
+                unescaped_ampersand += 1
         if unescaped_percent:
-            issues.append(f"Found {len(unescaped_percent)} unescaped percent signs (%) in content")
-
-        # Check for unescaped ampersands only in content after \begin{document}
-        doc_start = content.find('\\begin{document}')
-        if doc_start != -1:
-            content_after_doc = content[doc_start:]
-            unescaped_ampersand = re.findall(r'(?<!\\)&(?!\w)', content_after_doc)
-            if unescaped_ampersand:
-                issues.append(f"Found {len(unescaped_ampersand)} unescaped ampersands (&) in content")
-
-        # Check for balanced braces
-        open_braces = content.count('{')
-        close_braces = content.count('}')
-        if open_braces != close_braces:
-            issues.append(f"Unbalanced braces: {open_braces} open, {close_braces} close")
-
-        # Check for required elements
-        required = [
-            '\\documentclass',
-            '\\begin{document}',
-            '\\end{document}'
-        ]
+            issues.append(f"Found {unescaped_percent} unescaped percent signs (%) in content")
+        if unescaped_ampersand:
+            issues.append(f"Found {unescaped_ampersand} unescaped ampersands (&) in content")
+
+    # Check for balanced braces
+    open_braces, close_braces = _count_braces(content)
+    if open_braces != close_braces:
+        issues.append(f"Unbalanced braces: {open_braces} open, {close_braces} close")
+
+    # Check for required elements. They must appear in this order in
+    # any valid document, so each search starts where the previous
+    # match ended and scans an ever-smaller suffix.
+    missing = []
+    pos = 0
+    for req in _REQUIRED_ELEMENTS:
+        found = content.find(req, pos)
+        if found == -1:
+            missing.append(req.decode('ascii'))
+        else:
+            pos = found + len(req)
 
-        missing = []
-        for req in required:
-            if req not in content:
-                missing.append(req)
+    if missing:
+        issues.append(f"Missing required elements: {missing}")
 
-        if missing:
-            issues.append(f"Missing required elements: {missing}")
+    # Report results with a single stdout write
+    if not issues:
+        lines.append("No syntax issues found!")
+        lines.append("LaTeX file appears to be valid")
+    else:
+        lines.append("Found the following issues:")
+        lines.extend(f"  - {issue}" for issue in issues)
 
-        # Report results
-        if not issues:
-            print("No syntax issues found!")
-            print("LaTeX file appears to be valid")
-            return True
-        else:
-            print("Found the following issues:")
-            for issue in issues:
-                print(f"  - {issue}")
-            return False
+    sys.stdout.write("\n".join(lines) + "\n")
+    return not issues
 
+def validate_latex_syntax(filename):
+    """Validate LaTeX syntax in the generated file"""
+    try:
+        with open(filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > _MMAP_THRESHOLD:
+                # Let the kernel page large files in on demand instead of
+                # copying them into a Python bytes object up front
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # Typical resumes are a few KB; one read is cheaper than
+                # setting up a mapping (and empty files cannot be mapped)
+                content = f.read()
     except Exception as e:
         print(f"Error reading file: {e}")
         return False
 
+    return _validate_content(content, filename)
+
 # =============================================================================
 # TEMPLATE GENERATION
 # =============================================================================
 
-def generate_readme_content():
-    """Generate README.md content"""
-    return """# Resume2LaTeX - Generate Formatted Resume in LaTeX
+# README.md body, materialized once at import; writing it is then a
+# single write_text call with no function-call or rebuild overhead
+_README_CONTENT = """# Resume2LaTeX - Generate Formatted Resume in LaTeX
 
 A python script that generates a formatted resume from structured JSON data to a formatted resume page in LaTeX format, with optional PDF compilation.
 
@@ -735,160 +837,185 @@ flowchart TB
 - Template includes detailed examples to guide users
 """
 
-def create_template():
-    """Create a new resume template file"""
-    template_content = {
-        "personal_info": {
-            "name": "John Doe",
-            "phone": "+44 7123 456789",
-            "email": "your.email@example.com",
-            "location": "City, Country",
-            "website": "your-website.com"
+# Resume template data, built once at import; create_template hands out a
+# deep copy so callers can mutate their own instance freely.
+_TEMPLATE = {
+    "personal_info": {
+        "name": "John Doe",
+        "phone": "+44 7123 456789",
+        "email": "your.email@example.com",
+        "location": "City, Country",
+        "website": "your-website.com"
+    },
+    "education": {
+        "institution": "University Name (e.g., University College London)",
+        "location": "City, Country",
+        "degree": "Degree Type (e.g., B.S. Computer Science)",
+        "period": "Start Date -- End Date (e.g., Sept. 2020 -- June 2024)",
+        "details": {
+            "core_modules": [
+                "Course Module 1 (e.g., Data Structures and Algorithms)",
+                "Course Module 2 (e.g., Database Systems)",
+                "Course Module 3 (e.g., Software Engineering)",
+                "Course Module 4 (e.g., Machine Learning)",
+                "Course Module 5 (or just leave blank)"
+            ],
+            "grade": "Expected Grade (e.g., First Class, 3.8 GPA)"
+        }
+    },
+    "professional_experience": [
+        {
+            "company": "Company Name 1 (e.g., Google Inc.)",
+            "location": "City, Country (e.g., Mountain View, CA, USA)",
+            "position": "Job Title (e.g., Software Engineer)",
+            "period": "Start Date -- End Date (e.g., Jan. 2024 -- Present)",
+            "description": [
+                "Description 1: Describe a specific accomplishment with quantifiable results (e.g., Increased efficiency by 25%)",
+                "Description 2: Another accomplishment with measurable impact",
+                "Description 3: Third accomplishment highlighting your skills and contributions"
+            ]
         },
-        "education": {
-            "institution": "University Name (e.g., University College London)",
-            "location": "City, Country",
-            "degree": "Degree Type (e.g., B.S. Computer Science)",
-            "period": "Start Date -- End Date (e.g., Sept. 2020 -- June 2024)",
-            "details": {
-                "core_modules": [
-                    "Course Module 1 (e.g., Data Structures and Algorithms)",
-                    "Course Module 2 (e.g., Database Systems)",
-                    "Course Module 3 (e.g., Software Engineering)",
-                    "Course Module 4 (e.g., Machine Learning)",
-                    "Course Module 5 (or just leave blank)"
-                ],
-                "grade": "Expected Grade (e.g., First Class, 3.8 GPA)"
-            }
+        {
+            "company": "Company Name 2 (e.g., Microsoft Corporation)",
+            "location": "City, Country (e.g., Redmond, WA, USA)",
+            "position": "Previous Job Title (e.g., Junior Developer)",
+            "period": "Start Date -- End Date (e.g., June 2023 -- Dec. 2023)",
+            "description": [
+                "Description 1: Specific accomplishment with metrics",
+                "Description 2: Another significant contribution",
+                "Description 3: Third achievement demonstrating your value"
+            ]
         },
-        "professional_experience": [
-            {
-                "company": "Company Name 1 (e.g., Google Inc.)",
-                "location": "City, Country (e.g., Mountain View, CA, USA)",
-                "position": "Job Title (e.g., Software Engineer)",
-                "period": "Start Date -- End Date (e.g., Jan. 2024 -- Present)",
-                "description": [
-                    "Description 1: Describe a specific accomplishment with quantifiable results (e.g., Increased efficiency by 25%)",
-                    "Description 2: Another accomplishment with measurable impact",
-                    "Description 3: Third accomplishment highlighting your skills and contributions"
-                ]
-            },
+        {
+            "company": "Company Name 3 (e.g., Startup Inc.)",
+            "location": "City, Country (e.g., San Francisco, CA, USA)",
+            "position": "Internship/Entry Level Position (e.g., Software Engineering Intern)",
+            "period": "Start Date -- End Date (e.g., May 2022 -- Aug. 2022)",
+            "description": [
+                "Description 1: Internship accomplishment",
+                "Description 2: Learning outcome or project contribution",
+                "Description 3: Skill development or team contribution"
+            ]
+        }
+    ],
+    "project_experience": [
+        {
+            "name": "Project Name 1 (e.g., E-commerce Platform)",
+            "period": "Start Date -- End Date (e.g., Mar. 2024 -- Mar. 2024)",
+            "description": [
+                "Description 1: Describe a key feature or functionality you implemented",
+                "Description 2: Another important feature or technical achievement",
+                "Description 3: Third feature highlighting your skills"
+            ]
+        },
+        {
+            "name": "Project Name 2 (e.g., Machine Learning Model)",
+            "period": "Start Date -- End Date (e.g., Jan. 2024 -- Mar. 2024)",
+            "description": [
+                "Description 1: Describe what you accomplished in this project",
+                "Description 2: Another significant outcome or learning",
+                "Description 3: Third achievement showing your project management or skills"
+            ]
+        },
+        {
+            "name": "Competition/Challenge Name (e.g., Hackathon Winner)",
+            "period": "Start Date -- End Date (e.g., Feb. 2024 -- Feb. 2024)",
+            "description": [
+                "Description 1: What you accomplished in the competition",
+                "Description 2: Another outcome or recognition",
+                "Description 3: Third achievement demonstrating your competitive skills"
+            ]
+        }
+    ],
+    "additional_information": {
+        "languages": [
             {
-                "company": "Company Name 2 (e.g., Microsoft Corporation)",
-                "location": "City, Country (e.g., Redmond, WA, USA)",
-                "position": "Previous Job Title (e.g., Junior Developer)",
-                "period": "Start Date -- End Date (e.g., June 2023 -- Dec. 2023)",
-                "description": [
-                    "Description 1: Specific accomplishment with metrics",
-                    "Description 2: Another significant contribution",
-                    "Description 3: Third achievement demonstrating your value"
-                ]
+                "language": "English",
+                "proficiency": "Native/Fluent/Intermediate/Basic"
             },
             {
-                "company": "Company Name 3 (e.g., Startup Inc.)",
-                "location": "City, Country (e.g., San Francisco, CA, USA)",
-                "position": "Internship/Entry Level Position (e.g., Software Engineering Intern)",
-                "period": "Start Date -- End Date (e.g., May 2022 -- Aug. 2022)",
-                "description": [
-                    "Description 1: Internship accomplishment",
-                    "Description 2: Learning outcome or project contribution",
-                    "Description 3: Skill development or team contribution"
-                ]
-            }
-        ],
-        "project_experience": [
-            {
-                "name": "Project Name 1 (e.g., E-commerce Platform)",
-                "period": "Start Date -- End Date (e.g., Mar. 2024 -- Mar. 2024)",
-                "description": [
-                    "Description 1: Describe a key feature or functionality you implemented",
-                    "Description 2: Another important feature or technical achievement",
-                    "Description 3: Third feature highlighting your skills"
-                ]
+                "language": "Second Language (e.g., Spanish)",
+                "proficiency": "Native/Fluent/Intermediate/Basic"
             },
             {
-                "name": "Project Name 2 (e.g., Machine Learning Model)",
-                "period": "Start Date -- End Date (e.g., Jan. 2024 -- Mar. 2024)",
-                "description": [
-                    "Description 1: Describe what you accomplished in this project",
-                    "Description 2: Another significant outcome or learning",
-                    "Description 3: Third achievement showing your project management or skills"
-                ]
+                "language": "Third Language (e.g., French)",
+                "proficiency": "Native/Fluent/Intermediate/Basic"
             },
             {
-                "name": "Competition/Challenge Name (e.g., Hackathon Winner)",
-                "period": "Start Date -- End Date (e.g., Feb. 2024 -- Feb. 2024)",
-                "description": [
-                    "Description 1: What you accomplished in the competition",
-                    "Description 2: Another outcome or recognition",
-                    "Description 3: Third achievement demonstrating your competitive skills"
-                ]
+                "language": "Fourth Language (e.g., Mandarin)",
+                "proficiency": "Native/Fluent/Intermediate/Basic"
             }
         ],
-        "additional_information": {
-            "languages": [
-                {
-                    "language": "English",
-                    "proficiency": "Native/Fluent/Intermediate/Basic"
-                },
-                {
-                    "language": "Second Language (e.g., Spanish)",
-                    "proficiency": "Native/Fluent/Intermediate/Basic"
-                },
-                {
-                    "language": "Third Language (e.g., French)",
-                    "proficiency": "Native/Fluent/Intermediate/Basic"
-                },
-                {
-                    "language": "Fourth Language (e.g., Mandarin)",
-                    "proficiency": "Native/Fluent/Intermediate/Basic"
-                }
-            ],
-            "skills": [
-                "Programming Language 1 (e.g., Python)",
-                "Programming Language 2 (e.g., JavaScript)",
-                "Database Technology (e.g., PostgreSQL)",
-                "Framework 1 (e.g., React)",
-                "Framework 2 (e.g., Django)",
-                "Tool 1 (e.g., Git)",
-                "Tool 2 (e.g., Docker)",
-                "Platform 1 (e.g., AWS)",
-                "Platform 2 (e.g., Google Cloud)"
-            ]
-        }
+        "skills": [
+            "Programming Language 1 (e.g., Python)",
+            "Programming Language 2 (e.g., JavaScript)",
+            "Database Technology (e.g., PostgreSQL)",
+            "Framework 1 (e.g., React)",
+            "Framework 2 (e.g., Django)",
+            "Tool 1 (e.g., Git)",
+            "Tool 2 (e.g., Docker)",
+            "Platform 1 (e.g., AWS)",
+            "Platform 2 (e.g., Google Cloud)"
+        ]
     }
+}
 
-    return template_content
+def create_template():
+    """Create a new resume template file"""
+    return copy.deepcopy(_TEMPLATE)
+
+# The serialized form is just as static as the dict, so encode it once at
+# import; writing the template then touches neither deepcopy nor the
+# JSON encoder. stdlib json disables its C fast path when indent is set,
+# so prefer orjson's C pretty-printer (byte-identical output) when present.
+if orjson is not None:
+    _TEMPLATE_JSON = orjson.dumps(_TEMPLATE, option=orjson.OPT_INDENT_2).decode('utf-8')
+else:
+    _TEMPLATE_JSON = json.dumps(_TEMPLATE, indent=2)
 
 # =============================================================================
 # PDF COMPILATION
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def find_pdflatex():
-    """Find pdflatex executable"""
+    """Find pdflatex executable
+
+    The resolved path is cached for the process lifetime; the PATH walk
+    and the fallback stat calls only happen once. Use
+    find_pdflatex.cache_clear() if PATH changes mid-process.
+    """
     # Check if pdflatex is in PATH
     if shutil.which("pdflatex"):
         return "pdflatex"
 
-    # If not found in PATH, check common LaTeX installation paths
-    common_paths = [
-        "/usr/local/texlive/2024basic/bin/universal-darwin/pdflatex",
-        "/usr/local/texlive/2023/bin/universal-darwin/pdflatex",
-        "/usr/local/texlive/2022/bin/universal-darwin/pdflatex",
-        "/Library/TeX/texbin/pdflatex",
-        "/usr/local/bin/pdflatex",
-        "/opt/homebrew/bin/pdflatex"
-    ]
+    # If not found in PATH, search the common LaTeX install locations.
+    # Globbing the TeX Live bin dirs keeps this working across yearly
+    # releases instead of pinning a hardcoded list of versions.
+    extra = os.pathsep.join(
+        glob.glob('/usr/local/texlive/*/bin/*')
+        + ['/Library/TeX/texbin', '/opt/homebrew/bin', '/usr/local/bin'])
+
+    return shutil.which('pdflatex',
+                        path=os.environ.get('PATH', '') + os.pathsep + extra)
 
-    for path in common_paths:
-        if os.path.exists(path):
-            return path
+@lru_cache(maxsize=1)
+def find_tectonic():
+    """Find the tectonic executable, if installed
 
-    return None
+    Tectonic compiles a document in a single subprocess, running as many
+    passes as cross-references need and caching resolved packages on
+    disk, so it is preferred over pdflatex when present.
+    """
+    return shutil.which("tectonic")
+
+# The OS never changes mid-run; platform.system() does a uname syscall
+# per call, so resolve it once at import
+_SYSTEM = platform.system()
 
 def install_latex():
     """Install LaTeX distribution based on platform"""
-    system = platform.system()
+    system = _SYSTEM
 
     if system == "Darwin":  # macOS
         print("To install LaTeX on macOS, please run the following command:")
@@ -897,13 +1024,22 @@ def install_latex():
         return False
 
     elif system == "Linux":
-        print("To install LaTeX on your system, please run one of the following commands:")
-        print()
-        print("For Debian/Ubuntu-based systems:")
-        print("  sudo apt-get update && sudo apt-get install -y texlive-full")
-        print()
-        print("For RHEL/CentOS-based systems:")
-        print("  sudo yum install -y texlive")
+        # Probe the package manager with shutil.which (a PATH access()
+        # loop, no fork/exec) so only the relevant command is shown
+        if shutil.which("apt-get"):
+            print("To install LaTeX on your system, please run:")
+            print("  sudo apt-get update && sudo apt-get install -y texlive-full")
+        elif shutil.which("yum"):
+            print("To install LaTeX on your system, please run:")
+            print("  sudo yum install -y texlive")
+        else:
+            print("To install LaTeX on your system, please run one of the following commands:")
+            print()
+            print("For Debian/Ubuntu-based systems:")
+            print("  sudo apt-get update && sudo apt-get install -y texlive-full")
+            print()
+            print("For RHEL/CentOS-based systems:")
+            print("  sudo yum install -y texlive")
         print()
         print("After installation, please run this script again.")
         return False
@@ -919,6 +1055,26 @@ def install_latex():
         print(f"Unsupported operating system: {system}")
         return False
 
+# Finished PDFs are cached per content hash, so recompiling an unchanged
+# document is a file copy instead of a multi-second engine run
+_PDF_CACHE_DIR = Path.home() / '.cache' / 'resume2latex'
+
+def _cached_pdf_path(tex_bytes, compiler):
+    """Return the cache location for this document/compiler combination
+
+    The key hashes the document bytes plus the compiler's resolved path
+    and mtime, so upgrading or switching TeX engines invalidates stale
+    entries. blake2b is the fastest hash the stdlib ships.
+    """
+    h = hashlib.blake2b(tex_bytes)
+    h.update(compiler.encode('utf-8'))
+    resolved = shutil.which(compiler) or compiler
+    try:
+        h.update(str(os.stat(resolved).st_mtime_ns).encode('ascii'))
+    except OSError:
+        pass
+    return _PDF_CACHE_DIR / f"{h.hexdigest()}.pdf"
+
 def compile_latex_to_pdf(latex_file):
     """Compile LaTeX file to PDF using pdflatex"""
     # Validate input file path
@@ -931,15 +1087,16 @@ def compile_latex_to_pdf(latex_file):
         return False
     
     try:
-        # Find pdflatex executable
-        pdflatex_path = find_pdflatex()
-        if not pdflatex_path:
+        # Prefer tectonic when installed; fall back to pdflatex
+        tectonic_path = find_tectonic()
+        pdflatex_path = None if tectonic_path else find_pdflatex()
+        if not tectonic_path and not pdflatex_path:
             print("Error: pdflatex not found in PATH.")
             print("Would you like to install a LaTeX distribution now? (y/n)")
 
             try:
                 user_input = get_single_char_input()
-                if user_input in ['y', 'yes']:
+                if user_input in _YES:
                     if install_latex():
                         print("Please restart your terminal and try again.")
                     return False
@@ -954,67 +1111,111 @@ def compile_latex_to_pdf(latex_file):
                 print("PDF compilation cancelled.")
                 return False
 
-        # Get the directory and filename
-        latex_path = Path(latex_file)
-        latex_dir = latex_path.parent
-        latex_name = latex_path.stem
+        # Get the directory and filename; plain os.path calls avoid the
+        # intermediate PurePath objects pathlib would allocate here
+        latex_dir, latex_base = os.path.split(latex_file)
+        latex_dir = latex_dir or '.'
+        latex_name = os.path.splitext(latex_base)[0]
 
         # Validate filename for security
-        if not re.match(r'^[a-zA-Z0-9_-]+$', latex_name):
+        if not _SAFE_NAME_RE.match(latex_name):
             print(f"Error: Invalid filename characters in: {latex_name}")
             return False
 
-        # Create a temporary directory for compilation
-        temp_dir = None
-        
+        # Serve an unchanged document straight from the PDF cache
         try:
-            temp_dir = tempfile.mkdtemp()
-            
-            # Copy the LaTeX file to the temporary directory
-            temp_latex_file = os.path.join(temp_dir, f"{latex_name}.tex")
-            shutil.copy2(latex_file, temp_latex_file)
+            with open(latex_file, 'rb') as f:
+                tex_bytes = f.read()
+        except OSError:
+            tex_bytes = None
+
+        cache_pdf = None
+        output_pdf = os.path.join(latex_dir, f"{latex_name}.pdf")
+        if tex_bytes is not None:
+            cache_pdf = _cached_pdf_path(tex_bytes, tectonic_path or pdflatex_path)
+            if cache_pdf.exists():
+                try:
+                    shutil.copy2(cache_pdf, output_pdf)
+                    print(f"Reusing cached PDF for unchanged {latex_file}")
+                    print(f"PDF generated successfully: {output_pdf}")
+                    return True
+                except OSError:
+                    pass  # Fall through to a real compile
 
-            # Run pdflatex with proper error handling
+        # Point pdflatex's aux/output files at a temporary directory and
+        # read the source in place; no input copy is needed, and only the
+        # finished PDF ever moves back out
+        with tempfile.TemporaryDirectory() as temp_dir:
             print(f"Compiling {latex_file} to PDF...")
 
-            result = safe_subprocess_run(
-                [pdflatex_path, "-interaction=nonstopmode", f"{latex_name}.tex"],
-                capture_output=True,
-                text=True,
-                check=False,  # Don't raise exception, handle manually
-                cwd=temp_dir
-            )
-
-            # Check if compilation was successful
-            if result.returncode != 0:
-                print(f"LaTeX compilation failed with return code: {result.returncode}")
-                if result.stdout:
-                    print("LaTeX output:")
-                    print(result.stdout)
-                if result.stderr:
-                    print("LaTeX errors:")
-                    print(result.stderr)
-                return False
+            if tectonic_path:
+                # Tectonic handles multi-pass resolution itself;
+                # --keep-logs leaves a .log behind for the failure report
+                commands = [[tectonic_path, "--keep-logs", "-o", temp_dir,
+                             os.path.abspath(latex_file)]]
+            else:
+                # Documents with cross-references need a second pass to
+                # settle them; the generated resumes never do, so this
+                # scan usually decides on a single pass
+                two_passes = tex_bytes is not None and any(
+                    tok in tex_bytes for tok in
+                    (b'\\ref{', b'\\cite{', b'\\tableofcontents'))
+
+                # -halt-on-error stops at the first problem instead of
+                # grinding through a broken document; the console log goes
+                # to /dev/null since pdflatex writes the same text to the
+                # .log file anyway. Any preliminary pass runs in
+                # -draftmode, which skips the PDF shipout entirely - only
+                # the last pass writes the file.
+                final_cmd = [pdflatex_path, "-interaction=nonstopmode", "-halt-on-error",
+                             f"-output-directory={temp_dir}", os.path.abspath(latex_file)]
+                commands = [final_cmd]
+                if two_passes:
+                    commands.insert(0, final_cmd[:1] + ["-draftmode"] + final_cmd[1:])
+
+            for cmd in commands:
+                result = safe_subprocess_run(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=False,  # Don't raise exception, handle manually
+                    cwd=latex_dir  # relative \includegraphics etc. resolve against the source
+                )
+                if result.returncode != 0:
+                    print(f"LaTeX compilation failed with return code: {result.returncode}")
+                    log_file = os.path.join(temp_dir, f"{latex_name}.log")
+                    try:
+                        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+                            log_tail = f.readlines()[-50:]
+                        print("LaTeX log (last lines):")
+                        sys.stdout.write("".join(log_tail))
+                    except OSError:
+                        print("No LaTeX log file was produced.")
+                    return False
+
+            # Move the generated PDF back to the original directory; when
+            # both sit on the same device this is a metadata-only rename
+            temp_pdf = os.path.join(temp_dir, f"{latex_name}.pdf")
+            if os.path.exists(temp_pdf):
+                if os.stat(temp_dir).st_dev == os.stat(latex_dir).st_dev:
+                    os.replace(temp_pdf, output_pdf)
+                else:
+                    shutil.move(temp_pdf, output_pdf)
+
+                # Populate the cache; a failure here never fails the build
+                if cache_pdf is not None:
+                    try:
+                        _PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                        shutil.copy2(output_pdf, cache_pdf)
+                    except OSError:
+                        pass
 
-            # Copy the generated PDF back to the original directory
-            pdf_file = f"{latex_name}.pdf"
-            if os.path.exists(os.path.join(temp_dir, pdf_file)):
-                output_pdf = os.path.join(latex_dir, pdf_file)
-                shutil.copy2(os.path.join(temp_dir, pdf_file), output_pdf)
                 print(f"PDF generated successfully: {output_pdf}")
                 return True
             else:
                 print("PDF file was not generated")
                 return False
 
-        finally:
-            # Clean up temporary directory
-            if temp_dir and os.path.exists(temp_dir):
-                try:
-                    shutil.rmtree(temp_dir)
-                except OSError:
-                    pass  # Ignore cleanup errors
-
     except subprocess.CalledProcessError as e:
         print(f"Error compiling PDF: {e}")
         if e.stderr:
@@ -1025,12 +1226,91 @@ def compile_latex_to_pdf(latex_file):
         print(f"Error during PDF compilation: {e}")
         return False
 
+def _compile_job(latex_file):
+    """Worker for parallel compilation: run one pdflatex job with its
+    console output buffered so logs from concurrent jobs don't interleave"""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        success = compile_latex_to_pdf(latex_file)
+    return success, log.getvalue()
+
+def compile_latex_batch(latex_files):
+    """Compile multiple LaTeX files to PDF in parallel
+
+    Each pdflatex run is an independent subprocess dominated by engine
+    startup, so overlapping the runs across CPU cores cuts the wall-clock
+    time roughly by min(len(latex_files), cores). Each job's output is
+    replayed sequentially as it completes to keep the logs readable.
+    """
+    # Resolve a compiler up front: the per-job path would otherwise
+    # prompt for installation once per worker
+    if not find_tectonic() and not find_pdflatex():
+        print("Error: pdflatex not found in PATH.")
+        print("Run with a single input file for installation instructions.")
+        return False
+
+    all_ok = True
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = [pool.submit(_compile_job, f) for f in latex_files]
+        for future in as_completed(futures):
+            success, log = future.result()
+            sys.stdout.write(log)
+            all_ok = all_ok and success
+    return all_ok
+
 # =============================================================================
 # MAIN FUNCTION
 # =============================================================================
 
-def main():
-    """Main function"""
+# Static CLI text, written with a single sys.stdout.write instead of one
+# print call (lock acquire + flush) per line.
+# Separator lines, built once instead of re-multiplied at each use
+_SEP = "—" * 50
+_RULE = "=" * 50
+
+_ERROR_TEXT = """
+ERROR: Either a Input file (JSON or LaTeX) or a specified command flag is required.
+
+Usage: python3 resume2latex.py <input_file> [options]
+
+Need help? (y/n)
+"""
+
+_HELP_TEXT = "\n" + _SEP + """
+
+# resume2latex.py is a Python script that converts resume info from JSON data to a formatted resume page in LaTeX.
+# 1. Create a new template JSON file to fill in, using:
+
+python3 resume2latex.py -t
+
+# 2. Generate resume from your JSON file
+
+python3 resume2latex.py resume.json
+
+# 3. Compile LaTeX file to PDF
+
+python3 resume2latex.py resume.tex -p
+
+# More options:
+  -h, --help        Show this help message and exit
+  -v, --validate    Validate the generated LaTeX file
+  -c, --check       Only check existing LaTeX file without generating new one
+  -t, --template    Create a new resume template JSON file
+  -p, --pdf         Compile LaTeX file to PDF
+  -o, --output [OUTPUT_NAME]
+                    Output LaTeX file path (default: YOUR-NAME_resume.tex)
+
+Good luck with everything!
+"""
+
+_FAREWELL_TEXT = _SEP + """\n
+Good luck with everything!
+
+"""
+
+@lru_cache(maxsize=None)
+def _build_parser():
+    """Build the argument parser (once; repeat main() calls reuse it)"""
     parser = argparse.ArgumentParser(
         description='resume2latex - Convert JSON to LaTeX',
         epilog="""Examples:
@@ -1043,7 +1323,7 @@ def main():
 
 Need help? (y/n)"""
     )
-    parser.add_argument('input_file', nargs='?', help='Input JSON file path or LaTeX file path (optional when using --template)')
+    parser.add_argument('input_file', nargs='*', help='Input JSON file path(s) or LaTeX file path(s) (optional when using --template)')
     parser.add_argument('-o', '--output',
                        help='Output LaTeX file path (default: YOUR-NAME_resume.tex)')
     parser.add_argument('-v', '--validate', action='store_true',
@@ -1055,17 +1335,32 @@ Need help? (y/n)"""
     parser.add_argument('-p', '--pdf', action='store_true',
                        help='Compile LaTeX file to PDF')
 
-    args = parser.parse_args()
+    return parser
+
+def main():
+    """Main function"""
+    args = _build_parser().parse_args()
 
     # If template mode, create a new template file
     if args.template:
-        template_content = create_template()
         template_file = "resume_template.json"
+        template_json = _TEMPLATE_JSON
 
         try:
-            with open(template_file, 'w', encoding='utf-8') as f:
-                json.dump(template_content, f, indent=2, ensure_ascii=False)
-            print(f"Template created successfully: {template_file}")
+            # Skip the write when a pristine template is already on disk;
+            # this also avoids touching the file's mtime for no reason
+            try:
+                with open(template_file, 'r', encoding='utf-8') as f:
+                    up_to_date = f.read() == template_json
+            except OSError:
+                up_to_date = False
+
+            if up_to_date:
+                print(f"Template already up to date: {template_file}")
+            else:
+                with open(template_file, 'w', encoding='utf-8') as f:
+                    f.write(template_json)
+                print(f"Template created successfully: {template_file}")
             print("You can now edit this file with your information and run:")
             print(f"   python3 resume2latex.py {template_file}")
             print("The template includes detailed examples in parentheses to help you fill it out properly.")
@@ -1074,17 +1369,18 @@ Need help? (y/n)"""
             print(f"Error creating template: {e}")
             sys.exit(1)
 
-    # If check mode, validate existing file
+    # If check mode, validate existing file(s)
     if args.check:
         if not args.input_file:
             print("Error: Input file required for check mode")
             sys.exit(1)
-        
-        if not validate_file_path(args.input_file):
-            print(f"Error: Invalid file path: {args.input_file}")
-            sys.exit(1)
-            
-        if validate_latex_syntax(args.input_file):
+
+        for input_file in args.input_file:
+            if not validate_file_path(input_file):
+                print(f"Error: Invalid file path: {input_file}")
+                sys.exit(1)
+
+        if all([validate_latex_syntax(f) for f in args.input_file]):
             sys.exit(0)
         else:
             sys.exit(1)
@@ -1096,11 +1392,9 @@ Need help? (y/n)"""
 
         try:
             user_input = get_single_char_input()
-            if user_input in ['y', 'yes']:
+            if user_input in _YES:
                 try:
-                    readme_content = generate_readme_content()
-                    with open('README.md', 'w', encoding='utf-8') as f:
-                        f.write(readme_content)
+                    Path('README.md').write_text(_README_CONTENT, encoding='utf-8')
                     print("README.md generated successfully!")
                     sys.exit(0)
                 except Exception as e:
@@ -1108,47 +1402,15 @@ Need help? (y/n)"""
                     sys.exit(1)
             else:
                 # Call error handling logic
-                print()
-                print("ERROR: Either a Input file (JSON or LaTeX) or a specified command flag is required.")
-                print()
-                print("Usage: python3 resume2latex.py <input_file> [options]")
-                print()
-                print("Need help? (y/n)")
+                sys.stdout.write(_ERROR_TEXT)
 
                 try:
                     help_input = get_single_char_input()
-                    if help_input in ['y', 'yes']:
-                        print()
-                        print("—" * 50)
-                        print()
-                        print("# resume2latex.py is a Python script that converts resume info from JSON data to a formatted resume page in LaTeX.")
-                        print("# 1. Create a new template JSON file to fill in, using:")
-                        print()
-                        print("python3 resume2latex.py -t")
-                        print()
-                        print("# 2. Generate resume from your JSON file")
-                        print()
-                        print("python3 resume2latex.py resume.json")
-                        print()
-                        print("# 3. Compile LaTeX file to PDF")
-                        print()
-                        print("python3 resume2latex.py resume.tex -p")
-                        print()
-                        print("# More options:")
-                        print("  -h, --help        Show this help message and exit")
-                        print("  -v, --validate    Validate the generated LaTeX file")
-                        print("  -c, --check       Only check existing LaTeX file without generating new one")
-                        print("  -t, --template    Create a new resume template JSON file")
-                        print("  -p, --pdf         Compile LaTeX file to PDF")
-                        print("  -o, --output [OUTPUT_NAME]")
-                        print("                    Output LaTeX file path (default: YOUR-NAME_resume.tex)")
-                        print()
-                        print("Good luck with everything!")
+                    if help_input in _YES:
+                        sys.stdout.write(_HELP_TEXT)
                         sys.exit(0)
-                    if help_input in ['n', 'no']:
-                        print("—" * 50 + "\n")
-                        print("Good luck with everything!")
-                        print()
+                    if help_input in _NO:
+                        sys.stdout.write(_FAREWELL_TEXT)
                         sys.exit(1)
                 except KeyboardInterrupt:
                     print("\nOperation cancelled.")
@@ -1157,72 +1419,85 @@ Need help? (y/n)"""
             print("\nOperation cancelled.")
             sys.exit(1)
 
-    # Validate input file path
-    if args.input_file and not validate_file_path(args.input_file):
-        print(f"Error: Invalid file path: {args.input_file}")
-        sys.exit(1)
-
-    # Check if input file is a LaTeX file (ends with .tex)
-    if args.input_file and args.input_file.endswith('.tex'):
-        # Direct LaTeX to PDF compilation
-        if args.pdf:
-            if compile_latex_to_pdf(args.input_file):
-                print("PDF compilation completed successfully!")
-                sys.exit(0)
-            else:
-                print("PDF compilation failed.")
-                sys.exit(1)
-        else:
-            print("For LaTeX files, use -p flag to compile to PDF")
+    # Validate input file paths
+    for input_file in args.input_file:
+        if not validate_file_path(input_file):
+            print(f"Error: Invalid file path: {input_file}")
             sys.exit(1)
 
-    # Load resume data from JSON
-    if args.input_file:
-        resume_data = load_resume_data(args.input_file)
-    else:
-        print("Error: No input file specified")
+    # An explicit output name only makes sense for a single input
+    if args.output and len(args.input_file) > 1:
+        print("Error: -o/--output cannot be used with multiple input files")
         sys.exit(1)
 
-    # Generate LaTeX content
-    latex_content = generate_resume_latex(resume_data)
+    # Process each input, collecting the .tex files to compile
+    tex_files = []
+    generated_any = False
+    for input_file in args.input_file:
+        # LaTeX files (ending with .tex) go straight to compilation
+        if input_file.endswith('.tex'):
+            if not args.pdf:
+                print("For LaTeX files, use -p flag to compile to PDF")
+                sys.exit(1)
+            tex_files.append(input_file)
+            continue
+
+        # Load resume data from JSON
+        resume_data = load_resume_data(input_file)
+
+        # Determine output filename
+        if args.output:
+            output_file = args.output
+            # Validate output file path
+            if not validate_file_path(output_file):
+                print(f"Error: Invalid output file path: {output_file}")
+                sys.exit(1)
+        else:
+            output_file = generate_output_filename(resume_data)
 
-    # Determine output filename
-    if args.output:
-        output_file = args.output
-        # Validate output file path
-        if not validate_file_path(output_file):
-            print(f"Error: Invalid output file path: {output_file}")
+        # Generate LaTeX content, streaming sections straight to the file.
+        # With -v the document is kept in memory instead, so validation
+        # doesn't re-read the bytes that were just written.
+        try:
+            if args.validate:
+                # One C-level encode, then a single open/write/close with
+                # no TextIOWrapper in between
+                latex_bytes = generate_resume_latex(resume_data).encode('utf-8')
+                Path(output_file).write_bytes(latex_bytes)
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    write_resume_latex(resume_data, f)
+            print(f"Resume generated successfully: {output_file}")
+        except Exception as e:
+            print(f"Error writing to {output_file}: {e}")
             sys.exit(1)
-    else:
-        output_file = generate_output_filename(resume_data)
-
-    # Write to file
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(latex_content)
-        print(f"Resume generated successfully: {output_file}")
+        generated_any = True
 
         # Validate if requested
         if args.validate:
-            print("\n" + "=" * 50)
-            if validate_latex_syntax(output_file):
+            print("\n" + _RULE)
+            if _validate_content(latex_bytes, output_file):
                 print("Resume generation and validation completed successfully!")
             else:
                 print("Resume generated but validation found issues.")
                 sys.exit(1)
 
-        # Compile to PDF if requested
         if args.pdf:
-            print("\n" + "=" * 50)
-            if compile_latex_to_pdf(output_file):
-                print("PDF compilation completed successfully!")
-            else:
-                print("PDF compilation failed.")
-                sys.exit(1)
-
-    except Exception as e:
-        print(f"Error writing to {output_file}: {e}")
-        sys.exit(1)
+            tex_files.append(output_file)
+
+    # Compile to PDF if requested; multiple files run in parallel
+    if args.pdf and tex_files:
+        if generated_any:
+            print("\n" + _RULE)
+        if len(tex_files) == 1:
+            compiled = compile_latex_to_pdf(tex_files[0])
+        else:
+            compiled = compile_latex_batch(tex_files)
+        if compiled:
+            print("PDF compilation completed successfully!")
+        else:
+            print("PDF compilation failed.")
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()